@@ -21,46 +21,92 @@ Examples:
 """
 
 import glob
-import json
+import hashlib
 import os
+import stat
 import sys
-from dataclasses import dataclass, asdict
-from typing import Any, Dict, List, Optional, Tuple
+import tempfile
+from contextlib import contextmanager, suppress
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple, TypeVar
 
 import click
-from eth_utils import keccak
+import orjson
+
+# Keccak-256 constructor, resolved once: pysha3, then OpenSSL (stock builds rarely
+# expose keccak; sha3_256 uses different padding), then pycryptodome.
+try:
+    from sha3 import keccak_256 as _keccak_256
+except ImportError:
+    try:
+        hashlib.new("keccak_256")
+    except ValueError:
+        from Crypto.Hash import keccak as _cryptodome_keccak
+
+        def _keccak_256(data: bytes = b""):
+            return _cryptodome_keccak.new(data=data, digest_bits=256)
+    else:
+        _keccak_256 = partial(hashlib.new, "keccak_256")
 
 # ------------------------------ helpers ------------------------------
 
+FileKey = Tuple[str, int, int]
+
+def _file_key(path: str) -> FileKey:
+    st = os.stat(path)
+    return (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+
 def load_abi_any(path: str) -> List[Dict[str, Any]]:
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    with open(path, "rb") as f:
+        data = orjson.loads(f.read())
+    abi = None
     if isinstance(data, list):
-        return data
-    if isinstance(data, dict):
+        abi = data
+    elif isinstance(data, dict):
         if isinstance(data.get("abi"), list):
-            return data["abi"]
-        if "result" in data:
-            try:
-                arr = json.loads(data["result"])
+            abi = data["abi"]
+        else:
+            # Etherscan wraps the ABI as a JSON string; error payloads are plain text
+            # ("Contract source code not verified"), so only decode what looks like a list
+            res = data.get("result")
+            if isinstance(res, str) and res.lstrip()[:1] == "[":
+                try:
+                    arr = orjson.loads(res)
+                except orjson.JSONDecodeError:
+                    arr = None
                 if isinstance(arr, list):
-                    return arr
-            except Exception:
-                pass
-    raise click.ClickException(f"Unrecognized ABI format: {path}")
+                    abi = arr
+    if abi is None:
+        raise click.ClickException(f"Unrecognized ABI format: {path}")
+    return abi
+
+# Canonicalize common Solidity shorthands
+_TYPE_ALIASES = {"uint": "uint256", "int": "int256"}
 
 def normalize_type(t: str) -> str:
-    # Canonicalize common Solidity shorthands
-    if t == "uint": return "uint256"
-    if t == "int": return "int256"
-    return t
+    return _TYPE_ALIASES.get(t, t)
 
 def event_signature(name: str, inputs: List[Dict[str, Any]]) -> str:
-    types = ",".join(normalize_type(i.get("type","")) for i in inputs)
-    return f"{name}({types})"
+    return _event_sig(name, tuple(normalize_type(i.get("type","")) for i in inputs))
+
+def _event_sig(name: str, types: Tuple[str, ...]) -> str:
+    return f"{name}({','.join(types)})"
 
+def _topic0(sig: str) -> str:
+    return "0x" + _keccak_256(sig.encode("utf-8")).digest().hex()
+
+@lru_cache(maxsize=4096)
 def topic0(sig: str) -> str:
-    return "0x" + keccak(text=sig).hex()
+    return _topic0(sig)
+
+@lru_cache(maxsize=4096)
+def _event_ids(name: str, types: Tuple[str, ...]) -> Tuple[str, str]:
+    # The one memo on the extraction path: standard events (Transfer, Approval, ...)
+    # repeat across most ABIs, so each (signature, topic0) is built and hashed once
+    sig = _event_sig(name, types)
+    return sig, _topic0(sig)
 
 # SQL type mappings (lossless & pragmatic)
 PG_TYPES = {
@@ -91,31 +137,86 @@ CH_TYPES = {
     "int256": "Decimal(76,0)",
 }
 
+def _sql_type_fn(types: Dict[str, str], default: str, array: str) -> Callable[[str], str]:
+    # Known scalars, their dynamic arrays and the uint/int shorthands resolve in a single
+    # lookup; only unmapped types fall through to the suffix check.
+    table = dict(types)
+    table.update({k + "[]": array for k in types})
+    table.update({alias: table[canon] for alias, canon in _TYPE_ALIASES.items() if canon in table})
+    get = table.get
+    def to_sql(sol: str) -> str:
+        t = get(sol)
+        if t is None:
+            # arrays: store as JSON for portability
+            t = array if sol.endswith("[]") else default
+        return t
+    return to_sql
+
+_to_pg = _sql_type_fn(PG_TYPES, "text", "jsonb")
+# BigQuery NUMERIC tops out at 38 digits, so full-width ints go to BIGNUMERIC
+_to_bq = _sql_type_fn({**BQ_TYPES, "uint256": "BIGNUMERIC", "int256": "BIGNUMERIC"}, "STRING", "JSON")
+_to_ch = _sql_type_fn(CH_TYPES, "String", "JSON")
+
+_SQL_TYPE_FNS: Dict[str, Callable[[str], str]] = {
+    "postgres": _to_pg,
+    "bigquery": _to_bq,
+    "clickhouse": _to_ch,
+}
+
 def to_sql_type(sol: str, target: str) -> str:
-    sol = normalize_type(sol)
-    base = sol
-    if sol.endswith("[]"):
-        # arrays: store as JSON for portability
-        return "jsonb" if target == "postgres" else ("JSON" if target == "bigquery" else "JSON")
-    if target == "postgres":
-        return PG_TYPES.get(base, "text")
-    if target == "bigquery":
-        return ("BIGNUMERIC" if base in ("uint256","int256") else BQ_TYPES.get(base, "STRING"))
-    if target == "clickhouse":
-        return CH_TYPES.get(base, "String")
-    return "text"
+    fn = _SQL_TYPE_FNS.get(target)
+    if fn is None:
+        return "JSON" if sol.endswith("[]") else "text"
+    return fn(sol)
+
+# Log metadata columns shared by every event table
+_COMMON_COLS: Dict[str, List[Tuple[str, str]]] = {
+    "postgres": [
+        ("block_number", "BIGINT"),
+        ("block_time", "TIMESTAMP"),
+        ("tx_hash", "BYTEA"),
+        ("log_index", "INT"),
+        ("address", _to_pg("address")),
+        ("topic0", "BYTEA"),
+    ],
+    "bigquery": [
+        ("block_number", "BIGINT"),
+        ("block_time", "TIMESTAMP"),
+        ("tx_hash", "BYTES"),
+        ("log_index", "INT"),
+        ("address", _to_bq("address")),
+        ("topic0", "BYTES"),
+    ],
+    "clickhouse": [
+        ("block_number", "UInt64"),
+        ("block_time", "DateTime"),
+        ("tx_hash", "FixedString(32)"),
+        ("log_index", "UInt32"),
+        ("address", _to_ch("address")),
+        ("topic0", "FixedString(32)"),
+    ],
+}
 
 # ------------------------------ models ------------------------------
 
+# Explicit __slots__ (not dataclass(slots=True), which needs 3.10): no per-instance
+# __dict__ for the thousands of params/events held during a large run.
+
 @dataclass
 class Param:
+    __slots__ = ("name", "type", "indexed", "position", "column")
     name: str
     type: str
     indexed: bool
     position: int
 
+    def __post_init__(self) -> None:
+        # Derived (not a field): lowercased DDL / JSON Schema column name
+        self.column = f"{'idx_' if self.indexed else 'data_'}{self.name or ('arg'+str(self.position))}".lower()
+
 @dataclass
 class EventModel:
+    __slots__ = ("file", "contract", "name", "anonymous", "signature", "topic0", "inputs", "table", "indexed_count")
     file: str
     contract: str
     name: str
@@ -124,121 +225,189 @@ class EventModel:
     topic0: str
     inputs: List[Param]
 
+    def __post_init__(self) -> None:
+        # Derived (not fields): lowercased table name, number of indexed topics
+        self.table = f"{self.contract}_{self.name}".lower()
+        self.indexed_count = sum(1 for p in self.inputs if p.indexed)
+
+def _event_to_jsonable(ev: EventModel) -> Dict[str, Any]:
+    # Flat equivalent of dataclasses.asdict(ev), minus its recursion and deepcopy
+    return {
+        "file": ev.file,
+        "contract": ev.contract,
+        "name": ev.name,
+        "anonymous": ev.anonymous,
+        "signature": ev.signature,
+        "topic0": ev.topic0,
+        "inputs": [
+            {"name": p.name, "type": p.type, "indexed": p.indexed, "position": p.position}
+            for p in ev.inputs
+        ],
+    }
+
 # ------------------------------ extraction ------------------------------
 
+# Extracted events keyed by (abspath, mtime_ns, size): a file is re-parsed only when it
+# changed. Only the events are kept; the raw ABI is dropped once extracted.
+_EVENTS_CACHE: Dict[FileKey, List[EventModel]] = {}
+
 def extract_events(path: str) -> List[EventModel]:
+    key = _file_key(path)
+    cached = _EVENTS_CACHE.get(key)
+    if cached is not None:
+        return cached
     abi = load_abi_any(path)
+    # Hot loop: bind globals locally and skip non-event entries in one pass
+    _norm, _Param, _Event, _ids = _TYPE_ALIASES.get, Param, EventModel, _event_ids
+    file = os.path.basename(path)
+    contract_name = os.path.splitext(file)[0]
     out: List[EventModel] = []
-    contract_name = os.path.splitext(os.path.basename(path))[0]
-    for it in abi:
-        if it.get("type") != "event":
-            continue
+    events_only = [item for item in abi if item.get("type") == "event"]
+    for it in events_only:
         name = it.get("name", "")
         ins = it.get("inputs", [])
-        sig = event_signature(name, ins)
-        t0 = topic0(sig)
-        params = []
-        for i, p in enumerate(ins):
-            params.append(Param(
-                name=p.get("name") or f"arg{i}",
-                type=normalize_type(p.get("type","")),
-                indexed=bool(p.get("indexed", False)),
-                position=i
-            ))
-        out.append(EventModel(
-            file=os.path.basename(path), contract=contract_name, name=name,
-            anonymous=bool(it.get("anonymous", False)),
+        types_tuple = tuple([_norm(i.get("type", ""), i.get("type", "")) for i in ins])
+        sig, t0 = _ids(name, types_tuple)
+        params = [
+            _Param(name=(p.get("name") or f"arg{i}"), type=types_tuple[i],
+                   indexed=bool(p.get("indexed")), position=i)
+            for i, p in enumerate(ins)
+        ]
+        out.append(_Event(
+            file=file, contract=contract_name, name=name,
+            anonymous=bool(it.get("anonymous")),
             signature=sig, topic0=t0, inputs=params
         ))
+    _EVENTS_CACHE[key] = out
     return out
 
+T = TypeVar("T")
+
+# Small inputs stay in-process: forking the pool outweighs the work there
+PARALLEL_MIN_FILES = 16
+
+def map_files(fn: Callable[[str], T], files: List[str]) -> Iterator[T]:
+    """Yield fn(file) for each file (in order), across a process pool for large sets.
+
+    fn should return finished output (strings), not EventModels: results are
+    pickled back to the parent, and the extraction caches live per worker.
+    """
+    workers = os.cpu_count() or 1
+    if workers < 2 or len(files) < PARALLEL_MIN_FILES:
+        yield from map(fn, files)
+        return
+    chunksize = max(1, min(16, len(files) // (workers * 4)))
+    # fork starts every worker up front: never more than there are chunks
+    workers = min(workers, -(-len(files) // chunksize))
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        yield from ex.map(fn, files, chunksize=chunksize)
+
+def iter_glob(pattern: str) -> Iterator[str]:
+    """glob.iglob, with a single-scandir fast path for the common "dir/*.ext" shape."""
+    head, tail = os.path.split(pattern)
+    suffix = tail[1:]
+    if not tail.startswith("*") or glob.has_magic(head) or glob.has_magic(suffix):
+        yield from glob.iglob(pattern)
+        return
+    suffix = os.path.normcase(suffix)
+    try:
+        with os.scandir(head or os.curdir) as it:
+            for e in it:
+                # like glob, "*" never matches dotfiles
+                if e.name[0] != "." and os.path.normcase(e.name).endswith(suffix) and e.is_file():
+                    yield os.path.join(head, e.name)
+    except OSError:
+        return
+
 def expand_paths(paths: List[str]) -> List[str]:
-    out: List[str] = []
+    seen: Dict[str, None] = {}  # ordered set: overlapping globs dedup in O(1)
     for p in paths:
-        g = glob.glob(p)
-        if g:
-            out.extend(g)
-        elif os.path.isfile(p):
-            out.append(p)
-    uniq = sorted(set(out))
-    if not uniq:
+        matched = False
+        for m in iter_glob(p):
+            seen[m] = None
+            matched = True
+        if not matched and os.path.isfile(p):
+            seen[p] = None
+    if not seen:
         raise click.ClickException("No ABI files found")
-    return uniq
+    # Sorted once at the end so output order stays reproducible
+    return sorted(seen)
 
 # ------------------------------ DDL generators ------------------------------
 
+# Identifier quoting and statement tail per target
+_DDL_QUOTE = {"postgres": "", "bigquery": "`", "clickhouse": "`"}
+_DDL_TAIL = {
+    "postgres": "\n);",
+    "bigquery": "\n);",
+    "clickhouse": "\n)\nENGINE = MergeTree()\nORDER BY (block_number, log_index);",
+}
+
 def ddl_for_event(ev: EventModel, target: str, schema: Optional[str]="public") -> str:
-    tbl = f"{ev.contract}_{ev.name}".lower()
+    to_sql = _SQL_TYPE_FNS.get(target)
+    if to_sql is None:
+        return ""
+    tbl = ev.table
     if target == "bigquery":
         # Dataset.table; caller can prepend dataset if needed
-        tblname = f"{tbl}"
+        tblname = f"`{tbl}`"
     elif target == "clickhouse":
-        tblname = f"{tbl}"
+        tblname = tbl
     else:
         tblname = f"{schema}.{tbl}"
 
-    # common columns
-    cols: List[Tuple[str,str]] = [
-        ("block_number", "BIGINT" if target != "clickhouse" else "UInt64"),
-        ("block_time", "TIMESTAMP" if target != "clickhouse" else "DateTime"),
-        ("tx_hash", "BYTEA" if target=="postgres" else ("BYTES" if target=="bigquery" else "FixedString(32)")),
-        ("log_index", "INT" if target!="clickhouse" else "UInt32"),
-        ("address", to_sql_type("address", target)),
-        ("topic0", "BYTEA" if target=="postgres" else ("BYTES" if target=="bigquery" else "FixedString(32)")),
-    ]
-    # indexed and data params
+    # One flat list of pieces, joined once: common columns, then indexed and data params
+    q = _DDL_QUOTE[target]
+    parts = [f"-- {ev.signature}\nCREATE TABLE IF NOT EXISTS {tblname} (\n  "]
+    sep = ""
+    for c, t in _COMMON_COLS[target]:
+        parts += (sep, q, c, q, " ", t)
+        sep = ",\n  "
     for p in ev.inputs:
-        sqlt = to_sql_type(p.type, target)
-        col = f"{'idx_' if p.indexed else 'data_'}{p.name or ('arg'+str(p.position))}".lower()
-        cols.append((col, sqlt))
-
-    # Build CREATE
-    if target == "postgres":
-        cols_sql = ",\n  ".join([f"{c} {t}" for c,t in cols])
-        return f"""-- {ev.signature}
-CREATE TABLE IF NOT EXISTS {tblname} (
-  {cols_sql}
-);"""
-    if target == "bigquery":
-        cols_sql = ",\n  ".join([f"`{c}` {t}" for c,t in cols])
-        return f"""-- {ev.signature}
-CREATE TABLE IF NOT EXISTS `{tblname}` (
-  {cols_sql}
-);"""
-    if target == "clickhouse":
-        cols_sql = ",\n  ".join([f"`{c}` {t}" for c,t in cols])
-        return f"""-- {ev.signature}
-CREATE TABLE IF NOT EXISTS {tblname} (
-  {cols_sql}
-)
-ENGINE = MergeTree()
-ORDER BY (block_number, log_index);"""
-    return ""
+        parts += (sep, q, p.column, q, " ", to_sql(p.type))
+    parts.append(_DDL_TAIL[target])
+    return "".join(parts)
+
+def _ddl_file(path: str, target: str, schema: Optional[str]) -> List[str]:
+    # Runs in pool workers: only the finished DDL strings cross the pipe
+    return [ddl_for_event(ev, target, schema) for ev in extract_events(path)]
 
 # ------------------------------ JSON schema ------------------------------
 
+# Shared, never-mutated schema fragments: each event copies the base mapping once and
+# points its param entries at these dicts instead of allocating fresh ones.
+_STRING_SCHEMA = {"type":"string"}
+_ARRAY_SCHEMA = {"type":"array", "items":{"type":"string"}}  # store as JSON/strings
+_BASE_SCHEMA_PROPS: Dict[str, Any] = {
+    "block_number": {"type":"integer"},
+    "block_time": {"type":"string", "format":"date-time"},
+    "tx_hash": _STRING_SCHEMA,
+    "log_index": {"type":"integer"},
+    "address": _STRING_SCHEMA,
+    "topic0": _STRING_SCHEMA,
+}
+_INT_SCHEMA = {"type":"string", "pattern":"^-?\\d+$"}
+_TYPE_TO_SCHEMA: Dict[str, Dict[str, Any]] = {
+    "uint256": _INT_SCHEMA,
+    "int256": _INT_SCHEMA,
+    "address": _STRING_SCHEMA,
+    "bytes32": _STRING_SCHEMA,
+    "bytes": _STRING_SCHEMA,
+    "bool": {"type":"boolean"},
+}
+
 def json_schema_for_event(ev: EventModel) -> Dict[str, Any]:
-    props: Dict[str, Any] = {
-        "block_number": {"type":"integer"},
-        "block_time": {"type":"string", "format":"date-time"},
-        "tx_hash": {"type":"string"},
-        "log_index": {"type":"integer"},
-        "address": {"type":"string"},
-        "topic0": {"type":"string"}
-    }
+    """JSON Schema for one event's log rows.
+
+    The top-level dict and its "properties" mapping are fresh per call, but the
+    per-property schemas are module-level fragments shared by every event: treat
+    them as read-only and copy one (dict(props[key])) before annotating it.
+    """
+    props = dict(_BASE_SCHEMA_PROPS)
+    get = _TYPE_TO_SCHEMA.get
     for p in ev.inputs:
-        key = f"{'idx_' if p.indexed else 'data_'}{p.name or ('arg'+str(p.position))}".lower()
         t = p.type
-        if t.endswith("[]"):
-            props[key] = {"type":"array", "items":{"type":"string"}}  # store as JSON/strings
-        elif t in ("uint256","int256"):
-            props[key] = {"type":"string", "pattern":"^-?\\d+$"}
-        elif t in ("address","bytes32","bytes"):
-            props[key] = {"type":"string"}
-        elif t == "bool":
-            props[key] = {"type":"boolean"}
-        else:
-            props[key] = {"type":"string"}
+        props[p.column] = _ARRAY_SCHEMA if t.endswith("[]") else get(t, _STRING_SCHEMA)
     return {
         "$schema":"https://json-schema.org/draft/2020-12/schema",
         "title": f"{ev.contract}.{ev.name}",
@@ -247,6 +416,61 @@ def json_schema_for_event(ev: EventModel) -> Dict[str, Any]:
         "additionalProperties": False
     }
 
+# ------------------------------ output ------------------------------
+
+@contextmanager
+def open_output(out: Optional[str], newline: Optional[str] = None) -> Iterator[TextIO]:
+    """Large-buffered file for --out, else stdout (left open).
+
+    The file is written to a unique temp file beside the target and only moved
+    over it on success, so a failing ABI halfway through never leaves a truncated
+    or partial document. A symlinked out is written through, not replaced.
+    """
+    if not out:
+        yield sys.stdout
+        return
+    target = os.path.realpath(out)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(target), prefix=os.path.basename(target) + ".")
+    try:
+        with open(fd, "w", newline=newline, encoding="utf-8", buffering=1 << 20) as f:
+            yield f
+        # mkstemp creates 0600; keep the existing file's mode, else the umask default
+        try:
+            mode = stat.S_IMODE(os.stat(target).st_mode)
+        except FileNotFoundError:
+            umask = os.umask(0)
+            os.umask(umask)
+            mode = 0o666 & ~umask
+        os.chmod(tmp, mode)
+        os.replace(tmp, target)
+    except BaseException:
+        with suppress(OSError):
+            os.remove(tmp)
+        raise
+
+def write_stdout(data: bytes) -> None:
+    """Hand a whole command's output to stdout in one write (no per-line click.echo)."""
+    stream = sys.stdout
+    buf = getattr(stream, "buffer", None)
+    if buf is None:
+        stream.write(data.decode("utf-8"))
+        return
+    stream.flush()
+    buf.write(data)
+    buf.flush()
+
+def write_json_doc(f: TextIO, per_file: Iterable[List[str]]) -> None:
+    # Streams the manifest item by item (items pre-rendered by _json_file);
+    # layout matches orjson OPT_INDENT_2 of the whole doc
+    f.write('{\n  "version": "topicfoundry.v1",\n  "events": [')
+    empty = True
+    for items in per_file:
+        for item in items:
+            f.write("\n    " if empty else ",\n    ")
+            f.write(item)
+            empty = False
+    f.write("]\n}" if empty else "\n  ]\n}")
+
 # ------------------------------ CLI ------------------------------
 
 @click.group(context_settings=dict(help_option_names=["-h","--help"]))
@@ -254,25 +478,36 @@ def cli():
     """topicfoundry — Forge event schemas & filters from ABIs."""
     pass
 
+def _build_file(path: str, pretty: bool) -> List[str]:
+    # One rendered entry per event: summary lines, or a JSON object indented for the array
+    evs = extract_events(path)
+    if pretty:
+        return [
+            "\n".join([f"{ev.file}: {ev.name}  topic0={ev.topic0}"] + [
+                f"   - [{'idx' if p.indexed else 'dat'}] {p.name}:{p.type}" for p in ev.inputs
+            ])
+            for ev in evs
+        ]
+    return [
+        orjson.dumps(_event_to_jsonable(ev), option=orjson.OPT_INDENT_2).decode().replace("\n", "\n  ")
+        for ev in evs
+    ]
+
 @cli.command("build")
 @click.argument("abi_paths", nargs=-1)
 @click.option("--pretty", is_flag=True, help="Console summary.")
 def build_cmd(abi_paths, pretty):
     """Print a concise summary for each event in given ABIs."""
     files = expand_paths(list(abi_paths))
-    events: List[EventModel] = []
-    for p in files:
-        events.extend(extract_events(p))
+    entries: List[str] = []
+    for rendered in map_files(partial(_build_file, pretty=pretty), files):
+        entries.extend(rendered)
 
     if pretty:
-        for ev in events:
-            click.echo(f"{ev.file}: {ev.name}  topic0={ev.topic0}")
-            for p in ev.inputs:
-                tag = "idx" if p.indexed else "dat"
-                click.echo(f"   - [{tag}] {p.name}:{p.type}")
-        click.echo(f"\nTotal events: {len(events)}")
+        text = "".join([e + "\n" for e in entries]) + f"\nTotal events: {len(entries)}\n"
+        write_stdout(text.encode("utf-8"))
     else:
-        click.echo(json.dumps([asdict(e) for e in events], indent=2))
+        click.echo("[\n  " + ",\n  ".join(entries) + "\n]" if entries else "[]")
 
 @cli.command("ddl")
 @click.argument("abi_paths", nargs=-1)
@@ -282,10 +517,23 @@ def ddl_cmd(abi_paths, target, schema):
     """Emit CREATE TABLE statements for all events."""
     files = expand_paths(list(abi_paths))
     out: List[str] = []
-    for p in files:
-        for ev in extract_events(p):
-            out.append(ddl_for_event(ev, target, schema))
-    click.echo("\n\n".join(out))
+    for ddls in map_files(partial(_ddl_file, target=target, schema=schema), files):
+        out.extend(ddls)
+    write_stdout(("\n\n".join(out) + "\n").encode("utf-8"))
+
+def _json_file(path: str) -> List[str]:
+    # Manifest items, already indented to their depth in the document
+    return [
+        orjson.dumps({
+            "file": ev.file,
+            "contract": ev.contract,
+            "event": ev.name,
+            "signature": ev.signature,
+            "topic0": ev.topic0,
+            "schema": json_schema_for_event(ev)
+        }, option=orjson.OPT_INDENT_2).decode().replace("\n", "\n    ")
+        for ev in extract_events(path)
+    ]
 
 @cli.command("json")
 @click.argument("abi_paths", nargs=-1)
@@ -293,51 +541,69 @@ def ddl_cmd(abi_paths, target, schema):
 def json_cmd(abi_paths, out):
     """Emit a JSON blob: manifest + JSON Schema per event."""
     files = expand_paths(list(abi_paths))
-    items = []
-    for p in files:
-        for ev in extract_events(p):
-            items.append({
-                "file": ev.file,
-                "contract": ev.contract,
-                "event": ev.name,
-                "signature": ev.signature,
-                "topic0": ev.topic0,
-                "schema": json_schema_for_event(ev)
-            })
-    doc = {"version":"topicfoundry.v1","events": items}
-    s = json.dumps(doc, indent=2)
+    per_file = map_files(_json_file, files)
+    if not out:
+        per_file = list(per_file)  # surface ABI errors before the first byte on stdout
+    with open_output(out) as f:
+        write_json_doc(f, per_file)
+        if not out:
+            f.write("\n")
     if out:
-        with open(out, "w", encoding="utf-8") as f:
-            f.write(s)
         click.echo(f"Wrote JSON schemas: {out}")
-    else:
-        click.echo(s)
+
+def _csv_text(s: str) -> str:
+    # Body of an always-quoted CSV field; embedded quotes are rare in ABIs
+    return s.replace('"', '""') if '"' in s else s
+
+def _dict_file(path: str) -> str:
+    # All CSV rows for one file
+    rows: List[str] = []
+    for ev in extract_events(path):
+        head = f'"{_csv_text(ev.contract)}","{_csv_text(ev.name)}","{_csv_text(ev.signature)}",{ev.topic0},'
+        rows.extend([
+            f'{head}{prm.position},"{_csv_text(prm.name)}",{prm.type},{1 if prm.indexed else 0}\r\n'
+            for prm in ev.inputs
+        ])
+    return "".join(rows)
 
 @cli.command("dict")
 @click.argument("abi_paths", nargs=-1)
 @click.option("--out", type=click.Path(writable=True), default=None, help="Write CSV data dictionary.")
 def dict_cmd(abi_paths, out):
     """Produce a CSV (stdout or file): event dictionary."""
-    import csv
     files = expand_paths(list(abi_paths))
-    rows = []
-    for p in files:
-        for ev in extract_events(p):
-            for prm in ev.inputs:
-                rows.append([
-                    ev.contract, ev.name, ev.signature, ev.topic0,
-                    prm.position, prm.name, prm.type, 1 if prm.indexed else 0
-                ])
+    per_file = map_files(_dict_file, files)
+    if not out:
+        per_file = list(per_file)  # surface ABI errors before the first byte on stdout
+    with open_output(out, newline="") as f:
+        f.write("contract,event,signature,topic0,position,param,type,indexed\r\n")
+        for rows in per_file:
+            f.write(rows)
     if out:
-        with open(out, "w", newline="", encoding="utf-8") as f:
-            w = csv.writer(f)
-            w.writerow(["contract","event","signature","topic0","position","param","type","indexed"])
-            w.writerows(rows)
         click.echo(f"Wrote dictionary: {out}")
-    else:
-        w = csv.writer(sys.stdout)
-        w.writerow(["contract","event","signature","topic0","position","param","type","indexed"])
-        w.writerows(rows)
+
+# topics[] tails per indexed-arg count; events carry at most 4 topics
+_PLACEHOLDER = "<topic for indexed arg>"
+_PLACEHOLDERS = [[_PLACEHOLDER] * n for n in range(5)]
+
+def _filters_file(path: str, pretty: bool) -> str:
+    # One file's stubs: a console block, or one JSON object per line
+    lines: List[str] = [f"== {os.path.basename(path)} =="] if pretty else []
+    for ev in extract_events(path):
+        # Build topics array with placeholders for indexed args
+        n = ev.indexed_count
+        topics = [ev.topic0] + (_PLACEHOLDERS[n] if n < len(_PLACEHOLDERS) else [_PLACEHOLDER] * n)
+        stub = {
+            "address": "<contract_address_if_known>",
+            "topics": topics
+        }
+        if pretty:
+            lines.append(f"  {ev.name} — topics: {topics}")
+        else:
+            lines.append(orjson.dumps({"event": ev.name, "filter": stub}).decode())
+    if pretty:
+        lines.append("")
+    return "".join([line + "\n" for line in lines])
 
 @cli.command("filters")
 @click.argument("abi_paths", nargs=-1)
@@ -345,27 +611,13 @@ def dict_cmd(abi_paths, out):
 def filters_cmd(abi_paths, pretty):
     """Print eth_getLogs topic stubs per event and per contract."""
     files = expand_paths(list(abi_paths))
-    for p in files:
-        evs = extract_events(p)
-        if pretty:
-            click.echo(f"== {os.path.basename(p)} ==")
-        for ev in evs:
-            # Build topics array with placeholders for indexed args
-            idx_count = sum(1 for prm in ev.inputs if prm.indexed)
-            topics = [ev.topic0] + ["<topic for indexed arg>"] * idx_count
-            stub = {
-                "address": "<contract_address_if_known>",
-                "topics": topics
-            }
-            if pretty:
-                click.echo(f"  {ev.name} — topics: {topics}")
-            else:
-                click.echo(json.dumps({"event": ev.name, "filter": stub}))
-        if pretty:
-            click.echo("")
-    if not pretty:
-        # nothing more to do; output already printed line by line
-        pass
+    blocks = map_files(partial(_filters_file, pretty=pretty), files)
+    if pretty:
+        for block in blocks:
+            click.echo(block, nl=False)
+    else:
+        # one JSON object per line, written in bulk
+        write_stdout("".join(blocks).encode("utf-8"))
 
 if __name__ == "__main__":
     cli()